@@ -22,7 +22,7 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import Sequence, Set, Mapping
 from datetime import date, time, datetime, timedelta
-from functools import reduce
+from functools import lru_cache, reduce
 from operator import xor as xor_operator
 
 from neo4j.conf import iter_items
@@ -41,6 +41,16 @@ from neo4j.time.hydration import (
 map_type = type(map(str, range(0)))
 
 
+def index_keys(keys):
+    """ Build a dictionary mapping each key to the position at which it
+    first occurs in a sequence of keys.
+    """
+    index = {}
+    for i, key in enumerate(keys):
+        index.setdefault(key, i)
+    return index
+
+
 class Record(tuple, Mapping):
     """ A :class:`.Record` is an immutable ordered collection of key-value
     pairs. It is generally closer to a :py:class:`namedtuple` than to a
@@ -50,7 +60,15 @@ class Record(tuple, Mapping):
 
     __keys = None
 
+    # Mapping of key to position, built on first use
+    __index = None
+
+    # Set on the subclasses made by _keyed, to the class they extend
+    __unkeyed = None
+
     def __new__(cls, iterable=()):
+        if cls.__unkeyed is not None:
+            cls = cls.__unkeyed
         keys = []
         values = []
         for key, value in iter_items(iterable):
@@ -60,6 +78,32 @@ class Record(tuple, Mapping):
         inst.__keys = tuple(keys)
         return inst
 
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _keyed(cls, keys):
+        """ Return a subclass of this class for records that all have the
+        given tuple of keys, for use when hydrating results. The keys and
+        key index are class attributes of the subclass rather than
+        instance attributes, so the instance dictionary of a hydrated
+        record is never filled; instances are created from a sequence of
+        values with :meth:`tuple.__new__`.
+        """
+        # A tuple subclass cannot have non-empty __slots__, so a record
+        # has to keep its keys either in its own dictionary or on its
+        # class. Hydrated records are numerous and share their keys, so
+        # they use the class, at the cost of `type(record)` being this
+        # subclass rather than Record itself.
+        return type(cls)(cls.__name__, (cls,), {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_Record__keys": keys,
+            "_Record__index": index_keys(keys),
+            "_Record__unkeyed": cls,
+        })
+
+    def __reduce__(self):
+        return self.__unkeyed or type(self), (self.items(),)
+
     def __repr__(self):
         return "<%s %s>" % (self.__class__.__name__,
                             " ".join("%s=%r" % (field, self[i]) for i, field in enumerate(self.__keys)))
@@ -71,6 +115,10 @@ class Record(tuple, Mapping):
         :param other:
         :return:
         """
+        if type(other) is type(self) and self.__unkeyed is not None:
+            # Hydrated records with the same keys share a class, so only
+            # the values need to be compared
+            return tuple.__eq__(self, other)
         compare_as_sequence = isinstance(other, Sequence)
         compare_as_mapping = isinstance(other, Mapping)
         if compare_as_sequence and compare_as_mapping:
@@ -115,8 +163,8 @@ class Record(tuple, Mapping):
         :return: a value
         """
         try:
-            index = self.__keys.index(str(key))
-        except ValueError:
+            index = self.index(str(key))
+        except KeyError:
             return default
         if 0 <= index < len(self):
             return super(Record, self).__getitem__(index)
@@ -135,10 +183,10 @@ class Record(tuple, Mapping):
                 return key
             raise IndexError(key)
         elif isinstance(key, str):
-            try:
-                return self.__keys.index(key)
-            except ValueError:
-                raise KeyError(key)
+            index = self.__index
+            if index is None:
+                index = self.__index = index_keys(self.__keys)
+            return index[key]
         else:
             raise TypeError(key)
 
@@ -287,15 +335,27 @@ class DataHydrator:
             b"d": hydrate_datetime,     # no time zone
             b"E": hydrate_duration,
         }
+        self._hydrate_value = self._build_value_hydrator()
+        self._record_keys = None
+        self._record_class = None
 
     def hydrate(self, values):
         """ Convert PackStream values into native values.
         """
+        return tuple(map(self._hydrate_value, values))
+
+    def _build_value_hydrator(self):
+        # Built once per hydrator rather than once per record; the
+        # closure keeps the recursive calls free of attribute lookups.
+        hydration_functions = self.hydration_functions
 
         def hydrate_(obj):
-            if isinstance(obj, Structure):
+            # Most values are scalars, so rule those out with a single check
+            if not isinstance(obj, (Structure, list, dict)):
+                return obj
+            elif isinstance(obj, Structure):
                 try:
-                    f = self.hydration_functions[obj.tag]
+                    f = hydration_functions[obj.tag]
                 except KeyError:
                     # If we don't recognise the structure
                     # type, just return it as-is
@@ -304,16 +364,20 @@ class DataHydrator:
                     return f(*map(hydrate_, obj.fields))
             elif isinstance(obj, list):
                 return list(map(hydrate_, obj))
-            elif isinstance(obj, dict):
-                return {key: hydrate_(value) for key, value in obj.items()}
             else:
-                return obj
+                return {key: hydrate_(value) for key, value in obj.items()}
 
-        return tuple(map(hydrate_, values))
+        return hydrate_
 
     def hydrate_records(self, keys, record_values):
+        if keys is not self._record_keys:
+            # Results pass the same keys object for every batch, so
+            # the record class is only looked up when that changes
+            self._record_keys = keys
+            self._record_class = Record._keyed(tuple(keys))
+        record_class = self._record_class
         for values in record_values:
-            yield Record(zip(keys, self.hydrate(values)))
+            yield tuple.__new__(record_class, self.hydrate(values))
 
 
 class DataDehydrator:
@@ -323,6 +387,8 @@ class DataDehydrator:
     def fix_parameters(cls, parameters):
         if not parameters:
             return {}
+        if not isinstance(parameters, dict):
+            parameters = dict(parameters)
         dehydrator = cls()
         try:
             dehydrated, = dehydrator.dehydrate([parameters])
@@ -44,6 +44,8 @@ from socket import (
     socket,
     SOL_SOCKET,
     SO_KEEPALIVE,
+    IPPROTO_TCP,
+    TCP_NODELAY,
     SHUT_RDWR,
     timeout as SocketTimeout,
     AF_INET,
@@ -935,6 +937,8 @@ def _connect(resolved_address, timeout, keep_alive):
         s.settimeout(t)
         keep_alive = 1 if keep_alive else 0
         s.setsockopt(SOL_SOCKET, SO_KEEPALIVE, keep_alive)
+        # Bolt is request/response; don't let Nagle hold back small writes
+        s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
     except SocketTimeout:
         log.debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
         log.debug("[#0000]  C: <CLOSE> %s", resolved_address)
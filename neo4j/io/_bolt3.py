@@ -32,6 +32,8 @@ from neo4j.io._common import (
     Response,
     InitResponse,
     CommitResponse,
+    pack_query,
+    packed_message,
 )
 from neo4j.meta import get_user_agent
 from neo4j.exceptions import (
@@ -64,6 +66,15 @@ from logging import getLogger
 log = getLogger("neo4j")
 
 
+# Messages without fields, packed once up front
+GOODBYE = packed_message(b"\x02")
+RESET = packed_message(b"\x0F")
+COMMIT = packed_message(b"\x12")
+ROLLBACK = packed_message(b"\x13")
+DISCARD_ALL = packed_message(b"\x2F")
+PULL_ALL = packed_message(b"\x3F")
+
+
 class Bolt3(Bolt):
     """ Protocol handler for Bolt 3.
 
@@ -84,6 +95,9 @@ class Bolt3(Bolt):
     #: The pool of which this connection is a member
     pool = None
 
+    # The local port, looked up from the socket on first use
+    _local_port = None
+
     def __init__(self, unresolved_address, sock, max_connection_lifetime, *, auth=None, user_agent=None, routing_context=None):
         self.unresolved_address = unresolved_address
         self.socket = sock
@@ -137,10 +151,14 @@ class Bolt3(Bolt):
 
     @property
     def local_port(self):
-        try:
-            return self.socket.getsockname()[1]
-        except IOError:
-            return 0
+        # This is logged with every message sent and received, so
+        # avoid a system call each time
+        if self._local_port is None:
+            try:
+                self._local_port = self.socket.getsockname()[1]
+            except IOError:
+                return 0
+        return self._local_port
 
     def get_base_headers(self):
         return {
@@ -183,12 +201,21 @@ class Bolt3(Bolt):
                 extra["tx_timeout"] = int(1000 * timeout)
             except TypeError:
                 raise TypeError("Timeout must be specified as a number of seconds")
-        fields = (query, parameters, extra)
-        log.debug("[#%04X]  C: RUN %s", self.local_port, " ".join(map(repr, fields)))
-        if query.upper() == u"COMMIT":
-            self._append(b"\x10", fields, CommitResponse(self, **handlers))
+        # Formatted lazily, as the query and parameters may be large
+        log.debug("[#%04X]  C: RUN %r %r %r", self.local_port, query, parameters, extra)
+        if len(query) == 6 and query.upper() == u"COMMIT":
+            response = CommitResponse(self, **handlers)
         else:
-            self._append(b"\x10", fields, Response(self, **handlers))
+            response = Response(self, **handlers)
+        # Written field by field rather than through _append, so that
+        # the query text can be copied in already encoded.
+        self.packer.pack_raw(b"\xB3\x10")
+        pack_query(self.packer, query)
+        self.packer.pack(parameters)
+        self.packer.pack(extra)
+        self.outbox.chunk()
+        self.outbox.chunk()
+        self.responses.append(response)
         self._is_reset = False
 
     def run_get_routing_table(self, on_success, on_failure, database=DEFAULT_DATABASE):
@@ -205,12 +232,12 @@ class Bolt3(Bolt):
     def discard(self, n=-1, qid=-1, **handlers):
         # Just ignore n and qid, it is not supported in the Bolt 3 Protocol.
         log.debug("[#%04X]  C: DISCARD_ALL", self.local_port)
-        self._append(b"\x2F", (), Response(self, **handlers))
+        self._append_packed(DISCARD_ALL, Response(self, **handlers))
 
     def pull(self, n=-1, qid=-1, **handlers):
         # Just ignore n and qid, it is not supported in the Bolt 3 Protocol.
         log.debug("[#%04X]  C: PULL_ALL", self.local_port)
-        self._append(b"\x3F", (), Response(self, **handlers))
+        self._append_packed(PULL_ALL, Response(self, **handlers))
         self._is_reset = False
 
     def begin(self, mode=None, bookmarks=None, metadata=None, timeout=None, db=None, **handlers):
@@ -240,11 +267,11 @@ class Bolt3(Bolt):
 
     def commit(self, **handlers):
         log.debug("[#%04X]  C: COMMIT", self.local_port)
-        self._append(b"\x12", (), CommitResponse(self, **handlers))
+        self._append_packed(COMMIT, CommitResponse(self, **handlers))
 
     def rollback(self, **handlers):
         log.debug("[#%04X]  C: ROLLBACK", self.local_port)
-        self._append(b"\x13", (), Response(self, **handlers))
+        self._append_packed(ROLLBACK, Response(self, **handlers))
 
     def _append(self, signature, fields=(), response=None):
         """ Add a message to the outgoing queue.
@@ -258,6 +285,17 @@ class Bolt3(Bolt):
         self.outbox.chunk()
         self.responses.append(response)
 
+    def _append_packed(self, message, response=None):
+        """ Add a message that has already been packed to the outgoing queue.
+
+        :arg message: the packed message, as produced by :func:`packed_message`
+        :arg response: a response object to handle callbacks
+        """
+        self.outbox.write(message)
+        self.outbox.chunk()
+        self.outbox.chunk()
+        self.responses.append(response)
+
     def reset(self):
         """ Add a RESET message to the outgoing queue, send
         it and consume all remaining messages.
@@ -267,16 +305,16 @@ class Bolt3(Bolt):
             raise BoltProtocolError("RESET failed %r" % metadata, address=self.unresolved_address)
 
         log.debug("[#%04X]  C: RESET", self.local_port)
-        self._append(b"\x0F", response=Response(self, on_failure=fail))
+        self._append_packed(RESET, Response(self, on_failure=fail))
         self.send_all()
         self.fetch_all()
         self._is_reset = True
 
     def _send_all(self):
-        data = self.outbox.view()
-        if data:
-            self.socket.sendall(data)
-            self.outbox.clear()
+        with self.outbox.view() as data:
+            if data:
+                self.socket.sendall(data)
+                self.outbox.clear()
 
     def send_all(self):
         """ Send all queued messages to the server.
@@ -425,7 +463,7 @@ class Bolt3(Bolt):
         if not self._closed:
             if not self._defunct:
                 log.debug("[#%04X]  C: GOODBYE", self.local_port)
-                self._append(b"\x02", ())
+                self._append_packed(GOODBYE)
                 try:
                     self._send_all()
                 except:
@@ -19,6 +19,7 @@
 # limitations under the License.
 
 from collections import deque
+from functools import lru_cache
 from ssl import SSLSocket
 from time import perf_counter
 from neo4j.api import (
@@ -33,6 +34,8 @@ from neo4j.io._common import (
     Response,
     InitResponse,
     CommitResponse,
+    pack_query,
+    packed_message,
 )
 from neo4j.meta import get_user_agent
 from neo4j.exceptions import (
@@ -63,6 +66,24 @@ from logging import getLogger
 log = getLogger("neo4j")
 
 
+# Messages without fields, packed once up front
+GOODBYE = packed_message(b"\x02")
+RESET = packed_message(b"\x0F")
+COMMIT = packed_message(b"\x12")
+ROLLBACK = packed_message(b"\x13")
+
+
+@lru_cache(maxsize=64)
+def packed_stream_request(signature, n, qid):
+    """ Return a packed PULL or DISCARD message. Only a handful of
+    distinct fetch sizes and query ids are used, so these are cached.
+    """
+    extra = {"n": n}
+    if qid != -1:
+        extra["qid"] = qid
+    return packed_message(signature, (extra,))
+
+
 class Bolt4x0(Bolt):
     """ Protocol handler for Bolt 4.0.
 
@@ -83,6 +104,9 @@ class Bolt4x0(Bolt):
     #: The pool of which this connection is a member
     pool = None
 
+    # The local port, looked up from the socket on first use
+    _local_port = None
+
     def __init__(self, unresolved_address, sock, max_connection_lifetime, *, auth=None, user_agent=None, routing_context=None):
         self.unresolved_address = unresolved_address
         self.socket = sock
@@ -136,10 +160,14 @@ class Bolt4x0(Bolt):
 
     @property
     def local_port(self):
-        try:
-            return self.socket.getsockname()[1]
-        except IOError:
-            return 0
+        # This is logged with every message sent and received, so
+        # avoid a system call each time
+        if self._local_port is None:
+            try:
+                self._local_port = self.socket.getsockname()[1]
+            except IOError:
+                return 0
+        return self._local_port
 
     def get_base_headers(self):
         return {
@@ -182,12 +210,21 @@ class Bolt4x0(Bolt):
                 extra["tx_timeout"] = int(1000 * timeout)
             except TypeError:
                 raise TypeError("Timeout must be specified as a number of seconds")
-        fields = (query, parameters, extra)
-        log.debug("[#%04X]  C: RUN %s", self.local_port, " ".join(map(repr, fields)))
-        if query.upper() == u"COMMIT":
-            self._append(b"\x10", fields, CommitResponse(self, **handlers))
+        # Formatted lazily, as the query and parameters may be large
+        log.debug("[#%04X]  C: RUN %r %r %r", self.local_port, query, parameters, extra)
+        if len(query) == 6 and query.upper() == u"COMMIT":
+            response = CommitResponse(self, **handlers)
         else:
-            self._append(b"\x10", fields, Response(self, **handlers))
+            response = Response(self, **handlers)
+        # Written field by field rather than through _append, so that
+        # the query text can be copied in already encoded.
+        self.packer.pack_raw(b"\xB3\x10")
+        pack_query(self.packer, query)
+        self.packer.pack(parameters)
+        self.packer.pack(extra)
+        self.outbox.chunk()
+        self.outbox.chunk()
+        self.responses.append(response)
         self._is_reset = False
 
     def run_get_routing_table(self, on_success, on_failure, database=DEFAULT_DATABASE):
@@ -211,18 +248,18 @@ class Bolt4x0(Bolt):
             )
 
     def discard(self, n=-1, qid=-1, **handlers):
-        extra = {"n": n}
-        if qid != -1:
-            extra["qid"] = qid
-        log.debug("[#%04X]  C: DISCARD %r", self.local_port, extra)
-        self._append(b"\x2F", (extra,), Response(self, **handlers))
+        if qid == -1:
+            log.debug("[#%04X]  C: DISCARD {'n': %r}", self.local_port, n)
+        else:
+            log.debug("[#%04X]  C: DISCARD {'n': %r, 'qid': %r}", self.local_port, n, qid)
+        self._append_packed(packed_stream_request(b"\x2F", n, qid), Response(self, **handlers))
 
     def pull(self, n=-1, qid=-1, **handlers):
-        extra = {"n": n}
-        if qid != -1:
-            extra["qid"] = qid
-        log.debug("[#%04X]  C: PULL %r", self.local_port, extra)
-        self._append(b"\x3F", (extra,), Response(self, **handlers))
+        if qid == -1:
+            log.debug("[#%04X]  C: PULL {'n': %r}", self.local_port, n)
+        else:
+            log.debug("[#%04X]  C: PULL {'n': %r, 'qid': %r}", self.local_port, n, qid)
+        self._append_packed(packed_stream_request(b"\x3F", n, qid), Response(self, **handlers))
         self._is_reset = False
 
     def begin(self, mode=None, bookmarks=None, metadata=None, timeout=None,
@@ -253,11 +290,11 @@ class Bolt4x0(Bolt):
 
     def commit(self, **handlers):
         log.debug("[#%04X]  C: COMMIT", self.local_port)
-        self._append(b"\x12", (), CommitResponse(self, **handlers))
+        self._append_packed(COMMIT, CommitResponse(self, **handlers))
 
     def rollback(self, **handlers):
         log.debug("[#%04X]  C: ROLLBACK", self.local_port)
-        self._append(b"\x13", (), Response(self, **handlers))
+        self._append_packed(ROLLBACK, Response(self, **handlers))
 
     def _append(self, signature, fields=(), response=None):
         """ Add a message to the outgoing queue.
@@ -271,6 +308,17 @@ class Bolt4x0(Bolt):
         self.outbox.chunk()
         self.responses.append(response)
 
+    def _append_packed(self, message, response=None):
+        """ Add a message that has already been packed to the outgoing queue.
+
+        :arg message: the packed message, as produced by :func:`packed_message`
+        :arg response: a response object to handle callbacks
+        """
+        self.outbox.write(message)
+        self.outbox.chunk()
+        self.outbox.chunk()
+        self.responses.append(response)
+
     def reset(self):
         """ Add a RESET message to the outgoing queue, send
         it and consume all remaining messages.
@@ -280,16 +328,16 @@ class Bolt4x0(Bolt):
             raise BoltProtocolError("RESET failed %r" % metadata, self.unresolved_address)
 
         log.debug("[#%04X]  C: RESET", self.local_port)
-        self._append(b"\x0F", response=Response(self, on_failure=fail))
+        self._append_packed(RESET, Response(self, on_failure=fail))
         self.send_all()
         self.fetch_all()
         self._is_reset = True
 
     def _send_all(self):
-        data = self.outbox.view()
-        if data:
-            self.socket.sendall(data)
-            self.outbox.clear()
+        with self.outbox.view() as data:
+            if data:
+                self.socket.sendall(data)
+                self.outbox.clear()
 
     def send_all(self):
         """ Send all queued messages to the server.
@@ -439,7 +487,7 @@ class Bolt4x0(Bolt):
         if not self._closed:
             if not self._defunct:
                 log.debug("[#%04X]  C: GOODBYE", self.local_port)
-                self._append(b"\x02", ())
+                self._append_packed(GOODBYE)
                 try:
                     self._send_all()
                 except:
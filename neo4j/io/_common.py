@@ -19,6 +19,8 @@
 # limitations under the License.
 
 
+from functools import lru_cache
+from io import BytesIO
 from struct import pack as struct_pack
 
 from neo4j.exceptions import (
@@ -27,6 +29,7 @@ from neo4j.exceptions import (
     ServiceUnavailable,
 )
 from neo4j.packstream import (
+    Packer,
     UnpackableBuffer,
     Unpacker,
 )
@@ -35,6 +38,96 @@ import logging
 log = logging.getLogger("neo4j")
 
 
+@lru_cache(maxsize=512)
+def packed_query(query):
+    """ Return the PackStream encoding of a query string.
+
+    Applications tend to run the same few query strings over and over,
+    so the encoded form is cached to save re-encoding the text (and
+    re-writing it to the outbox piecemeal) on every RUN.
+    """
+    stream = BytesIO()
+    Packer(stream).pack(query)
+    return stream.getvalue()
+
+
+# Longer queries are rarely repeated word for word (they tend to carry
+# inline literals), so caching them would only hold on to memory
+MAX_CACHED_QUERY_LENGTH = 4096
+
+
+def pack_query(packer, query):
+    """ Pack a query string, copying in the cached encoding if the query
+    is short enough to be cached.
+    """
+    if len(query) <= MAX_CACHED_QUERY_LENGTH:
+        packer.pack_raw(packed_query(query))
+    else:
+        packer.pack(query)
+
+
+def packed_message(signature, fields=()):
+    """ Return the PackStream encoding of a message, so that messages
+    whose content is fixed can be encoded once and reused.
+    """
+    stream = BytesIO()
+    Packer(stream).pack_struct(signature, fields)
+    return stream.getvalue()
+
+
+class ReceiveBuffer:
+    """ Read-ahead buffer sitting between a socket and the chunk reader.
+
+    Each read from the socket pulls in as much data as is available, up
+    to the capacity of the buffer, so that many small chunks can be
+    framed from a single system call rather than two calls per chunk.
+    """
+
+    def __init__(self, sock, capacity=65536):
+        self._socket = sock
+        self._data = bytearray(capacity)
+        self._view = memoryview(self._data)
+        self._start = 0
+        self._end = 0
+
+    def recv_into(self, buffer, nbytes):
+        """ Copy up to `nbytes` of received data into `buffer`, reading
+        from the socket only if no data is currently held.
+        """
+        if self._start == self._end:
+            self._start = 0
+            self._end = self._socket.recv_into(self._view, len(self._data))
+        start = self._start
+        n = min(nbytes, self._end - start)
+        buffer[:n] = self._view[start:(start + n)]
+        self._start = start + n
+        return n
+
+    def receive_message(self, buffer):
+        """ Move the next message into `buffer`, stripped of its chunk
+        headers, skipping any NOOP chunks that come before it.
+
+        Chunk headers already held are decoded in place, and only an
+        incomplete header or chunk requires a read from the socket.
+        """
+        data = self._data
+        while True:
+            start = self._start
+            if self._end - start >= 2:
+                chunk_size = (data[start] << 8) | data[start + 1]
+                self._start = start + 2
+            else:
+                buffer.receive(self, 2)
+                chunk_size = buffer.pop_u16()
+            if chunk_size:
+                buffer.receive(self, chunk_size)
+            elif buffer.used:
+                # chunk_size was the end marker for the message
+                return
+            else:
+                log.debug("[#%04X]  S: <NOOP>", self._socket.getsockname()[1])
+
+
 class MessageInbox:
 
     def __init__(self, s, on_error):
@@ -45,26 +138,14 @@ class MessageInbox:
         try:
             buffer = UnpackableBuffer()
             unpacker = Unpacker(buffer)
-            chunk_size = 0
+            received = ReceiveBuffer(sock)
             while True:
-
-                while chunk_size == 0:
-                    # Determine the chunk size and skip noop
-                    buffer.receive(sock, 2)
-                    chunk_size = buffer.pop_u16()
-                    if chunk_size == 0:
-                        log.debug("[#%04X]  S: <NOOP>", sock.getsockname()[1])
-
-                buffer.receive(sock, chunk_size + 2)
-                chunk_size = buffer.pop_u16()
-
-                if chunk_size == 0:
-                    # chunk_size was the end marker for the message
-                    size, tag = unpacker.unpack_structure_header()
-                    fields = [unpacker.unpack() for _ in range(size)]
-                    yield tag, fields
-                    # Reset for new message
-                    unpacker.reset()
+                received.receive_message(buffer)
+                size, tag = unpacker.unpack_structure_header()
+                fields = [unpacker.unpack() for _ in range(size)]
+                yield tag, fields
+                # Reset for new message
+                unpacker.reset()
 
         except OSError as error:
             self.on_error(error)
@@ -129,12 +210,17 @@ class Outbox:
         self._data[self._header:self._start] = b"\x00\x00"
 
     def view(self):
+        """ Return a view onto the buffered data, without copying it.
+
+        The view must be released before anything further is written,
+        as the underlying buffer cannot be resized while it is exported.
+        """
         end = self._end
         chunk_size = end - self._start
         if chunk_size == 0:
-            return memoryview(self._data[:self._header])
+            return memoryview(self._data)[:self._header]
         else:
-            return memoryview(self._data[:end])
+            return memoryview(self._data)[:end]
 
 
 class Response:
@@ -142,6 +228,10 @@ class Response:
     more detail messages followed by one summary message).
     """
 
+    # One of these is created for every message sent, so instance
+    # dictionaries are avoided
+    __slots__ = ("connection", "handlers", "complete")
+
     def __init__(self, connection, **handlers):
         self.connection = connection
         self.handlers = handlers
@@ -191,6 +281,8 @@ class Response:
 
 class InitResponse(Response):
 
+    __slots__ = ()
+
     def on_failure(self, metadata):
         code = metadata.get("code")
         message = metadata.get("message", "Connection initialisation failed")
@@ -202,4 +294,4 @@ class InitResponse(Response):
 
 class CommitResponse(Response):
 
-    pass
+    __slots__ = ()
@@ -21,7 +21,8 @@
 
 from codecs import decode
 from io import BytesIO
-from struct import pack as struct_pack, unpack as struct_unpack
+from struct import Struct, pack as struct_pack, unpack as struct_unpack
+from sys import intern
 
 PACKED_UINT_8 = [struct_pack(">B", value) for value in range(0x100)]
 PACKED_UINT_16 = [struct_pack(">H", value) for value in range(0x10000)]
@@ -33,6 +34,12 @@ UNPACKED_MARKERS = {b"\xC0": None, b"\xC2": False, b"\xC3": True}
 UNPACKED_MARKERS.update({bytes(bytearray([z])): z for z in range(0x00, 0x80)})
 UNPACKED_MARKERS.update({bytes(bytearray([z + 256])): z for z in range(-0x10, 0x00)})
 
+FLOAT_64 = Struct(">d")
+INT_8 = Struct(">b")
+INT_16 = Struct(">h")
+INT_32 = Struct(">i")
+INT_64 = Struct(">q")
+
 
 INT64_MIN = -(2 ** 63)
 INT64_MAX = 2 ** 63
@@ -393,8 +400,7 @@ class Unpacker:
 
         # Float
         elif marker == 0xC1:
-            value, = struct_unpack(">d", self.read(8))
-            return value
+            return self.unpackable.read_struct(FLOAT_64)
 
         # Boolean
         elif marker == 0xC2:
@@ -404,13 +410,13 @@ class Unpacker:
 
         # Integer
         elif marker == 0xC8:
-            return struct_unpack(">b", self.read(1))[0]
+            return self.unpackable.read_struct(INT_8)
         elif marker == 0xC9:
-            return struct_unpack(">h", self.read(2))[0]
+            return self.unpackable.read_struct(INT_16)
         elif marker == 0xCA:
-            return struct_unpack(">i", self.read(4))[0]
+            return self.unpackable.read_struct(INT_32)
         elif marker == 0xCB:
-            return struct_unpack(">q", self.read(8))[0]
+            return self.unpackable.read_struct(INT_64)
 
         # Bytes
         elif marker == 0xCC:
@@ -492,6 +498,14 @@ class Unpacker:
         else:
             return
 
+    def _unpack_key(self):
+        # Map keys (property names, for example) repeat across many
+        # values, so intern them to keep a single copy of each
+        key = self._unpack()
+        if type(key) is str:
+            return intern(key)
+        return key
+
     def unpack_map(self):
         marker = self.read_u8()
         return self._unpack_map(marker)
@@ -502,35 +516,35 @@ class Unpacker:
             size = marker & 0x0F
             value = {}
             for _ in range(size):
-                key = self._unpack()
+                key = self._unpack_key()
                 value[key] = self._unpack()
             return value
         elif marker == 0xD8:  # MAP_8:
             size, = struct_unpack(">B", self.read(1))
             value = {}
             for _ in range(size):
-                key = self._unpack()
+                key = self._unpack_key()
                 value[key] = self._unpack()
             return value
         elif marker == 0xD9:  # MAP_16:
             size, = struct_unpack(">H", self.read(2))
             value = {}
             for _ in range(size):
-                key = self._unpack()
+                key = self._unpack_key()
                 value[key] = self._unpack()
             return value
         elif marker == 0xDA:  # MAP_32:
             size, = struct_unpack(">I", self.read(4))
             value = {}
             for _ in range(size):
-                key = self._unpack()
+                key = self._unpack_key()
                 value[key] = self._unpack()
             return value
         elif marker == 0xDB:  # MAP_STREAM:
             value = {}
             key = None
             while key is not EndOfStream:
-                key = self._unpack()
+                key = self._unpack_key()
                 if key is not EndOfStream:
                     value[key] = self._unpack()
             return value
@@ -564,6 +578,9 @@ class UnpackableBuffer:
         else:
             self.data = bytearray(data)
             self.used = len(self.data)
+        # A single long-lived view onto the data, sliced for every read
+        # and receive rather than creating a new view each time
+        self.view = memoryview(self.data)
         self.p = 0
 
     def reset(self):
@@ -571,12 +588,19 @@ class UnpackableBuffer:
         self.p = 0
 
     def read(self, n=1):
-        view = memoryview(self.data)
         q = self.p + n
-        subview = view[self.p:q]
+        subview = self.view[self.p:q]
         self.p = q
         return subview
 
+    def read_struct(self, s):
+        """ Read a single value using a precompiled :class:`struct.Struct`,
+        straight from the data without taking a view of it first.
+        """
+        p = self.p
+        self.p = p + s.size
+        return s.unpack_from(self.data, p)[0]
+
     def read_u8(self):
         if self.used - self.p >= 1:
             value = self.data[self.p]
@@ -599,8 +623,11 @@ class UnpackableBuffer:
     def receive(self, sock, n_bytes):
         end = self.used + n_bytes
         if end > len(self.data):
+            # The data cannot be resized while the view is held
+            self.view.release()
             self.data += bytearray(end - len(self.data))
-        view = memoryview(self.data)
+            self.view = memoryview(self.data)
+        view = self.view
         while self.used < end:
             n = sock.recv_into(view[self.used:end], end - self.used)
             if n == 0:
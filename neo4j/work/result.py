@@ -20,6 +20,7 @@
 
 
 from collections import deque
+from sys import intern
 from warnings import warn
 
 from neo4j.data import DataDehydrator
@@ -57,12 +58,22 @@ class Result:
         self._run(query, parameters, None, None, None, **kwparameters)
 
     def _run(self, query, parameters, db, access_mode, bookmarks, **kwparameters):
+        if kwparameters:
+            parameters = dict(parameters or {}, **kwparameters)
+        # Dehydration builds a new dictionary, so the caller's is left untouched
+        parameters = DataDehydrator.fix_parameters(parameters)
+        self._append_run(query, parameters, db, access_mode, bookmarks)
+        self._connection.send_all()
+        self._attach()
+
+    def _append_run(self, query, parameters, db, access_mode, bookmarks):
+        """Queue up RUN and PULL messages for this result, without sending them.
+        The parameters must already have been dehydrated.
+        """
         query_text = str(query)  # Query or string object
         query_metadata = getattr(query, "metadata", None)
         query_timeout = getattr(query, "timeout", None)
 
-        parameters = DataDehydrator.fix_parameters(dict(parameters or {}, **kwparameters))
-
         self._metadata = {
             "query": query_text,
             "parameters": parameters,
@@ -78,6 +89,9 @@ class Result:
             self._metadata.update(metadata)
             self._qid = metadata.get("qid", -1)  # For auto-commit there is no qid and Bolt 3 do not support qid
             self._keys = metadata.get("fields")
+            # Shared by every record of this result, and interned so that
+            # key lookups using string literals match on identity
+            self._record_keys = tuple(map(intern, self._keys or ()))
             self._attached = True
 
         def on_failed_attach(metadata):
@@ -97,15 +111,13 @@ class Result:
             on_failure=on_failed_attach,
         )
         self._pull()
-        self._connection.send_all()
-        self._attach()
 
     def _pull(self):
 
         def on_records(records):
             self._streaming = True
             if not self._discarding:
-                self._record_buffer.extend(self._hydrant.hydrate_records(self._keys, records))
+                self._record_buffer.extend(self._hydrant.hydrate_records(self._record_keys, records))
 
         def on_summary():
             self._attached = False
@@ -201,12 +213,22 @@ class Result:
             while self._attached is False:
                 self._connection.fetch_message()
 
+    def _queue_discard(self):
+        """Discard the remainder of this result. Any records already on their way are received, then
+        a DISCARD is queued for those left on the server, but not sent, so that it can go out together
+        with the next message.
+        """
+        self._discarding = True
+        while self._attached and not (self._has_more and self._streaming is False):
+            self._connection.fetch_message()
+        if self._attached:
+            self._streaming = True  # The DISCARD is in flight
+            self._discard()
+
     def _buffer_all(self):
         """Sets the Result object in an detached state by fetching all records from the connection to the buffer.
         """
-        record_buffer = deque()
-        for record in self:
-            record_buffer.append(record)
+        record_buffer = deque(self)
         self._closed = False
         self._record_buffer = record_buffer
 
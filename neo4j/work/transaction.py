@@ -20,7 +20,10 @@
 
 
 from neo4j.work.result import Result
-from neo4j.data import DataHydrator
+from neo4j.data import (
+    DataHydrator,
+    DataDehydrator,
+)
 from neo4j._exceptions import BoltIncompleteCommitError
 from neo4j.exceptions import (
     ServiceUnavailable,
@@ -69,6 +72,23 @@ class Transaction:
             result.consume()
         self._results = []
 
+    def _create_results(self, count):
+        """ Create and register the given number of new results.
+        """
+        if self._results and self._connection.supports_multiple_results is False:
+            # Bolt 3 Support
+            self._results[-1]._buffer_all()  # Buffer up all records for the previous Result because it does not have any qid to fetch in batches.
+        results = [Result(self._connection, DataHydrator(), self._fetch_size, self._result_on_closed_handler)
+                   for _ in range(count)]
+        self._results.extend(results)
+        return results
+
+    def _queue_discards(self):
+        # Any DISCARD needed is sent together with the message that
+        # follows, rather than waiting on a round trip of its own
+        for result in self._results:
+            result._queue_discard()
+
     def run(self, query, parameters=None, **kwparameters):
         """ Run a Cypher query within the context of this transaction.
 
@@ -108,17 +128,56 @@ class Transaction:
         if self._closed:
             raise TransactionError("Transaction closed")
 
-        if self._results and self._connection.supports_multiple_results is False:
-            # Bolt 3 Support
-            self._results[-1]._buffer_all()  # Buffer upp all records for the previous Result because it does not have any qid to fetch in batches.
-
-        result = Result(self._connection, DataHydrator(), self._fetch_size, self._result_on_closed_handler)
-        self._results.append(result)
-
+        result, = self._create_results(1)
         result._tx_ready_run(query, parameters, **kwparameters)
 
         return result
 
+    def run_batch(self, queries):
+        """ Run several Cypher queries within the context of this
+        transaction, sending them to the server together.
+
+        Each query is given as a ``(query, parameters)`` pair, where the
+        parameters may be :const:`None`. All of the queries are written
+        to the network in one go before any response is read, so the
+        whole batch costs a single round trip rather than one per query::
+
+            >>> results = tx.run_batch([
+            ...     ("CREATE (a:Person {name: $name})", {"name": "Alice"}),
+            ...     ("CREATE (a:Person {name: $name})", {"name": "Bob"}),
+            ...     ("MATCH (a:Person) RETURN count(a)", None),
+            ... ])
+
+        :param queries: iterable of ``(query, parameters)`` pairs
+        :returns: a list of new :class:`neo4j.Result` objects, in the
+                  same order as the queries
+        :rtype: list
+        :raise TransactionError: if the transaction is already closed
+        """
+        from neo4j.work.simple import Query
+
+        # Check everything before queueing anything, so that a bad query
+        # cannot leave part of the batch waiting to go out with the next send.
+        queries = list(queries)
+        for query, _ in queries:
+            if isinstance(query, Query):
+                raise ValueError("Query object is only supported for session.run")
+
+        if self._closed:
+            raise TransactionError("Transaction closed")
+
+        batch = [(query, DataDehydrator.fix_parameters(parameters)) for query, parameters in queries]
+
+        results = self._create_results(len(batch))
+        for result, (query, parameters) in zip(results, batch):
+            result._append_run(query, parameters, None, None, None)
+
+        self._connection.send_all()
+        for result in results:
+            result._attach()
+
+        return results
+
     def commit(self):
         """Mark this transaction as successful and close in order to trigger a COMMIT.
 
@@ -127,7 +186,7 @@ class Transaction:
         if self._closed:
             raise TransactionError("Transaction closed")
         metadata = {}
-        self._consume_results()  # DISCARD pending records then do a commit.
+        self._queue_discards()  # DISCARD pending records then do a commit.
         try:
             self._connection.commit(on_success=metadata.update)
             self._connection.send_all()
@@ -136,6 +195,7 @@ class Transaction:
             self._closed = True
             self._on_closed()
             raise ServiceUnavailable("Connection closed during commit")
+        self._consume_results()
         self._bookmark = metadata.get("bookmark")
         self._closed = True
         self._on_closed()
@@ -151,10 +211,11 @@ class Transaction:
             raise TransactionError("Transaction closed")
         metadata = {}
         if not self._connection._is_reset:
-            self._consume_results()  # DISCARD pending records then do a rollback.
+            self._queue_discards()  # DISCARD pending records then do a rollback.
             self._connection.rollback(on_success=metadata.update)
             self._connection.send_all()
             self._connection.fetch_all()
+            self._consume_results()
         self._closed = True
         self._on_closed()
 
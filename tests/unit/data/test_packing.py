@@ -23,6 +23,7 @@ import struct
 from collections import OrderedDict
 from io import BytesIO
 from math import pi
+from sys import intern
 from unittest import TestCase
 from uuid import uuid4
 
@@ -300,6 +301,30 @@ class PackStreamTestCase(TestCase):
             raise AssertionError("Unpacked value %r is not equal to expected %r" %
                                  (unpacked, unpacked_value))
 
+    def test_map_keys_are_interned(self):
+        key = "".join(["na", "me"])  # built at runtime, so not interned
+        packed = self.packb({key: 1})
+        first = Unpacker(UnpackableBuffer(packed)).unpack()
+        second = Unpacker(UnpackableBuffer(packed)).unpack()
+        first_key, = first
+        second_key, = second
+        assert first_key is second_key is intern(key)
+
+    def test_buffer_grows_while_unpacking(self):
+
+        class Source(BytesIO):
+
+            def recv_into(self, buffer, nbytes):
+                return self.readinto(buffer[:nbytes])
+
+        small, large = "x" * 10, "y" * 20000
+        buffer = UnpackableBuffer()
+        unpacker = Unpacker(buffer)
+        for value in (small, large):
+            packed = self.packb(value)
+            buffer.receive(Source(packed), len(packed))
+            assert unpacker.unpack() == value
+
     def test_map_size_overflow(self):
         stream_out = BytesIO()
         packer = Packer(stream_out)
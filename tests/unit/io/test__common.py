@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2020 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from neo4j.io._common import (
+    CommitResponse,
+    MessageInbox,
+    Outbox,
+    ReceiveBuffer,
+    Response,
+    MAX_CACHED_QUERY_LENGTH,
+    pack_query,
+    packed_query,
+)
+from neo4j.packstream import Packer
+
+
+class CountingSocket:
+
+    def __init__(self, data, max_read=None):
+        self.data = bytearray(data)
+        self.max_read = max_read
+        self.reads = 0
+
+    def getsockname(self):
+        return "127.0.0.1", 0xFFFF
+
+    def recv_into(self, buffer, nbytes):
+        self.reads += 1
+        if self.max_read:
+            nbytes = min(nbytes, self.max_read)
+        data = self.data[:nbytes]
+        actual = len(data)
+        buffer[:actual] = data
+        self.data = self.data[actual:]
+        return actual
+
+
+@pytest.mark.parametrize("nbytes", [1, 2, 3, 7])
+def test_receive_buffer_serves_small_reads_from_one_recv(nbytes):
+    sock = CountingSocket(b"\x00\x01\x02\x03\x04\x05\x06")
+    received = ReceiveBuffer(sock)
+    target = bytearray(nbytes)
+    data = bytearray()
+    while len(data) < 7:
+        n = received.recv_into(target, nbytes)
+        data += target[:n]
+    assert data == b"\x00\x01\x02\x03\x04\x05\x06"
+    assert sock.reads == 1
+
+
+def test_receive_buffer_reports_closed_socket():
+    sock = CountingSocket(b"")
+    received = ReceiveBuffer(sock)
+    assert received.recv_into(bytearray(2), 2) == 0
+
+
+def test_inbox_frames_many_messages_from_one_recv():
+    # Two SUCCESS messages, each in a single chunk, followed by end markers
+    message = b"\x00\x03\xB1\x70\xA0\x00\x00"
+    sock = CountingSocket(message * 2)
+    inbox = MessageInbox(sock, on_error=print)
+    assert inbox.pop() == (b"\x70", [{}])
+    assert inbox.pop() == (b"\x70", [{}])
+    assert sock.reads == 1
+
+
+@pytest.mark.parametrize("max_read", [1, 2, 3, None])
+def test_inbox_joins_chunks_and_skips_noops(max_read):
+    # A NOOP, then a SUCCESS message split over two chunks
+    sock = CountingSocket(b"\x00\x00\x00\x02\xB1\x70\x00\x01\xA0\x00\x00", max_read)
+    inbox = MessageInbox(sock, on_error=print)
+    assert inbox.pop() == (b"\x70", [{}])
+
+
+def test_outbox_view_does_not_copy():
+    outbox = Outbox(capacity=8)
+    outbox.write(b"\x01\x02\x03")
+    outbox.chunk()
+    with outbox.view() as data:
+        assert data.tobytes() == b"\x00\x03\x01\x02\x03"
+        assert data.obj is outbox._data
+    # The view has been released, so the buffer may grow again
+    outbox.write(b"\x04" * 16)
+    outbox.chunk()
+    with outbox.view() as data:
+        assert len(data) == 23
+
+
+def test_packed_query_is_cached():
+    query = "RETURN $x AS x, " + "1 AS y, " * 10
+    assert packed_query(query) is packed_query(query)
+    assert packed_query(query)[:2] == b"\xD0\x60"
+
+
+def test_long_queries_are_not_cached():
+    query = "RETURN 1 AS x // " + "-" * MAX_CACHED_QUERY_LENGTH
+    outbox = Outbox()
+    before = packed_query.cache_info()
+    pack_query(Packer(outbox), query)
+    after = packed_query.cache_info()
+    assert (after.hits, after.misses) == (before.hits, before.misses)
+    with outbox.view() as data:
+        assert data[2:5].tobytes() == b"\xD1\x10\x11"
+
+
+@pytest.mark.parametrize("cls", [Response, CommitResponse])
+def test_responses_have_no_instance_dict(cls):
+    response = cls(None, on_success=print)
+    assert not hasattr(response, "__dict__")
+    assert response.handlers == {"on_success": print}
@@ -85,3 +85,14 @@ def test_simple_pull(fake_socket):
     tag, fields = socket.pop_message()
     assert tag == b"\x3F"
     assert len(fields) == 0
+
+
+def test_simple_commit_and_rollback(fake_socket):
+    address = ("127.0.0.1", 7687)
+    socket = fake_socket(address)
+    connection = Bolt3(address, socket, PoolConfig.max_connection_lifetime)
+    connection.commit()
+    connection.rollback()
+    connection.send_all()
+    assert socket.pop_message() == (b"\x12", [])
+    assert socket.pop_message() == (b"\x13", [])
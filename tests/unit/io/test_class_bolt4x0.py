@@ -172,3 +172,17 @@ def test_n_and_qid_extras_in_pull(fake_socket):
     assert tag == b"\x3F"
     assert len(fields) == 1
     assert fields[0] == {"n": 666, "qid": 777}
+
+
+def test_long_query_in_run(fake_socket):
+    address = ("127.0.0.1", 7687)
+    socket = fake_socket(address)
+    connection = Bolt4x0(address, socket, PoolConfig.max_connection_lifetime)
+    query = "UNWIND range(1, 10) AS n RETURN n" * 1000
+    connection.run(query, {"x": 1})
+    connection.run(query)
+    connection.send_all()
+    for parameters in ({"x": 1}, {}):
+        tag, fields = socket.pop_message()
+        assert tag == b"\x10"
+        assert fields == [query, parameters, {}]
@@ -21,7 +21,11 @@
 
 import pytest
 
-from neo4j.data import DataHydrator
+from neo4j.data import (
+    DataDehydrator,
+    DataHydrator,
+    Record,
+)
 from neo4j.packstream import Structure
 
 # python -m pytest -s -v tests/unit/test_data.py
@@ -78,3 +82,38 @@ def test_can_hydrate_in_dict():
     assert alice.labels == {"Person"}
     assert set(alice.keys()) == {"name"}
     assert alice.get("name") == "Alice"
+
+
+def test_scalars_pass_through_unchanged():
+    hydrant = DataHydrator()
+
+    values = [1, 2.5, "three", None, True, b"\x04", [5, {"six": 6}]]
+    assert hydrant.hydrate(values) == tuple(values)
+
+
+def test_hydrated_records_share_keys():
+    hydrant = DataHydrator()
+
+    keys = ("name", "age")
+    first, second = hydrant.hydrate_records(keys, [["Alice", 33], ["Bob", 44]])
+
+    assert dict(first) == {"name": "Alice", "age": 33}
+    assert dict(second) == {"name": "Bob", "age": 44}
+    assert first._Record__keys is second._Record__keys
+    assert first._Record__keys == keys
+    # Hydrated records are instances of a Record subclass made for their keys
+    assert type(first) is type(second)
+    assert type(first) is not Record and isinstance(first, Record)
+
+
+def test_fixed_parameters_are_a_copy():
+    parameters = {"name": "Alice", "tags": ["a", "b"]}
+    fixed = DataDehydrator.fix_parameters(parameters)
+
+    assert fixed == parameters
+    assert fixed is not parameters
+    assert fixed["tags"] is not parameters["tags"]
+
+
+def test_fix_parameters_accepts_key_value_pairs():
+    assert DataDehydrator.fix_parameters([("name", "Alice")]) == {"name": "Alice"}
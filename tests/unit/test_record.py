@@ -19,9 +19,14 @@
 # limitations under the License.
 
 
+import pickle
+
 import pytest
 
-from neo4j.data import Record
+from neo4j.data import (
+    DataHydrator,
+    Record,
+)
 
 # python -m pytest -s -v tests/unit/test_record.py
 
@@ -35,6 +40,14 @@ def test_record_equality():
     assert record2 != record3
 
 
+def test_record_equality_with_different_keys():
+    record1 = Record(zip(["name", "empire"], ["Nigel", "The British Empire"]))
+    record2 = Record(zip(["name", "realm"], ["Nigel", "The British Empire"]))
+    assert record1 != record2
+    assert record1 == {"name": "Nigel", "empire": "The British Empire"}
+    assert record1 == ["Nigel", "The British Empire"]
+
+
 def test_record_hashing():
     record1 = Record(zip(["name", "empire"], ["Nigel", "The British Empire"]))
     record2 = Record(zip(["name", "empire"], ["Nigel", "The British Empire"]))
@@ -180,3 +193,34 @@ def test_record_get_by_name():
 def test_record_get_by_out_of_bounds_index():
     r = Record(zip(["name", "age", "married"], ["Alice", 33, True]))
     assert r[9] is None
+
+
+def test_record_index_with_duplicate_keys():
+    r = Record(zip(["x", "y", "x"], [1, 2, 3]))
+    assert r.index("x") == 0
+    assert r["x"] == 1
+    assert r.get("x") == 1
+
+
+def test_constructed_records_are_plain_records():
+    r = Record(zip(["name", "age"], ["Alice", 33]))
+    assert type(r) is Record
+    assert type(r[:1]) is Record
+
+
+@pytest.mark.parametrize("record", [
+    Record(zip(["name", "age"], ["Alice", 33])),
+    next(DataHydrator().hydrate_records(("name", "age"), [["Alice", 33]])),
+])
+def test_record_pickling(record):
+    unpickled = pickle.loads(pickle.dumps(record))
+    assert type(unpickled) is Record
+    assert unpickled == record
+    assert unpickled.keys() == record.keys()
+
+
+def test_record_get():
+    r = Record(zip(["name", "age", "married"], ["Alice", 33, True]))
+    assert r.get("name") == "Alice"
+    assert r.get("shoe size") is None
+    assert r.get("shoe size", 6) == 6
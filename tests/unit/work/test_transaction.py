@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2020 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+from neo4j.conf import PoolConfig
+from neo4j.io._bolt3 import Bolt3
+from neo4j.io._bolt4 import Bolt4x0
+from neo4j.io._common import Outbox
+from neo4j.packstream import Packer
+from neo4j.work.transaction import Transaction
+from neo4j.work.simple import Query
+
+
+def packed_messages(*messages):
+    outbox = Outbox()
+    packer = Packer(outbox)
+    for tag, fields in messages:
+        packer.pack_struct(tag, fields)
+        outbox.chunk()
+        outbox.chunk()
+    with outbox.view() as data:
+        return data.tobytes()
+
+
+def test_run_batch_sends_all_queries_at_once(fake_socket_2):
+    address = ("127.0.0.1", 7687)
+    sent = []
+    socket = fake_socket_2(address, on_send=sent.append)
+    socket.inject(packed_messages(
+        (b"\x70", ({},)),                               # BEGIN
+        (b"\x70", ({"fields": ["x"], "qid": 0},)),      # RUN
+        (b"\x71", ([1],)),
+        (b"\x70", ({},)),                               # PULL
+        (b"\x70", ({"fields": ["y"], "qid": 1},)),      # RUN
+        (b"\x71", ([2],)),
+        (b"\x70", ({},)),                               # PULL
+    ))
+    connection = Bolt4x0(address, socket, PoolConfig.max_connection_lifetime)
+    tx = Transaction(connection, 1000, on_closed=lambda: None)
+    tx._begin(None, None, None, None, None)
+
+    result1, result2 = tx.run_batch([
+        ("RETURN 1 AS x", None),
+        ("RETURN $y AS y", {"y": 2}),
+    ])
+
+    assert len(sent) == 1
+    assert [record["y"] for record in result2] == [2]
+    assert [record["x"] for record in result1] == [1]
+
+
+def test_run_batch_on_bolt3_buffers_the_previous_result(fake_socket_2):
+    address = ("127.0.0.1", 7687)
+    sent = []
+    buffered = []
+
+    def on_send(data):
+        sent.append(bytes(data))
+        if tx._results:
+            buffered.append(len(tx._results[0]._record_buffer))
+
+    socket = fake_socket_2(address, on_send=on_send)
+    socket.inject(packed_messages(
+        (b"\x70", ({},)),                               # BEGIN
+        (b"\x70", ({"fields": ["n"]},)),                # RUN
+        (b"\x71", ([1],)),
+        (b"\x71", ([2],)),
+        (b"\x70", ({},)),                               # PULL_ALL
+    ))
+    socket.inject(packed_messages(
+        (b"\x70", ({"fields": ["x"]},)),                # RUN
+        (b"\x71", ([3],)),
+        (b"\x70", ({},)),                               # PULL_ALL
+        (b"\x70", ({"fields": ["y"]},)),                # RUN
+        (b"\x71", ([4],)),
+        (b"\x70", ({},)),                               # PULL_ALL
+    ))
+    connection = Bolt3(address, socket, PoolConfig.max_connection_lifetime)
+    tx = Transaction(connection, 1000, on_closed=lambda: None)
+    tx._begin(None, None, None, None, None)
+    result = tx.run("UNWIND [1, 2] AS n RETURN n")
+
+    result1, result2 = tx.run_batch([
+        ("RETURN 3 AS x", None),
+        ("RETURN $y AS y", {"y": 4}),
+    ])
+
+    # The earlier result was read in full before the batch went out, in one send
+    assert len(sent) == 2
+    assert buffered == [0, 2]
+    assert sent[1].count(b"\xB3\x10") == 2 and sent[1].count(b"\xB0\x3F") == 2
+    assert [record["n"] for record in result] == [1, 2]
+    assert [record["x"] for record in result1] == [3]
+    assert [record["y"] for record in result2] == [4]
+
+
+def test_run_batch_rejects_query_objects(fake_socket_2):
+    address = ("127.0.0.1", 7687)
+    sent = []
+    socket = fake_socket_2(address, on_send=sent.append)
+    connection = Bolt4x0(address, socket, PoolConfig.max_connection_lifetime)
+    tx = Transaction(connection, 1000, on_closed=lambda: None)
+
+    with pytest.raises(ValueError):
+        tx.run_batch([("RETURN 1", None), (Query("RETURN 2"), None)])
+    assert not connection.responses
+
+
+def test_commit_sends_discard_and_commit_together(fake_socket_2):
+    address = ("127.0.0.1", 7687)
+    sent = []
+    socket = fake_socket_2(address, on_send=lambda data: sent.append(bytes(data)))
+    socket.inject(packed_messages(
+        (b"\x70", ({},)),                               # BEGIN
+        (b"\x70", ({"fields": ["x"], "qid": 0},)),      # RUN
+        (b"\x71", ([1],)),
+        (b"\x70", ({"has_more": True},)),               # PULL
+        (b"\x70", ({},)),                               # DISCARD
+        (b"\x70", ({"bookmark": "bm"},)),               # COMMIT
+    ))
+    connection = Bolt4x0(address, socket, PoolConfig.max_connection_lifetime)
+    tx = Transaction(connection, 1, on_closed=lambda: None)
+    tx._begin(None, None, None, None, None)
+    result = tx.run("UNWIND [1, 2] AS x RETURN x")
+
+    assert tx.commit() == "bm"
+    assert len(sent) == 2
+    assert b"\xB1\x2F" in sent[1] and b"\xB0\x12" in sent[1]
+    assert list(result) == []
+
+
+def test_records_of_a_result_share_their_keys(fake_socket_2):
+    address = ("127.0.0.1", 7687)
+    socket = fake_socket_2(address)
+    socket.inject(packed_messages(
+        (b"\x70", ({},)),                               # BEGIN
+        (b"\x70", ({"fields": ["x", "y"], "qid": 0},)), # RUN
+        (b"\x71", ([1, 2],)),
+        (b"\x71", ([3, 4],)),
+        (b"\x70", ({},)),                               # PULL
+    ))
+    connection = Bolt4x0(address, socket, PoolConfig.max_connection_lifetime)
+    tx = Transaction(connection, 1000, on_closed=lambda: None)
+    tx._begin(None, None, None, None, None)
+
+    first, second = tx.run("UNWIND [[1, 2], [3, 4]] AS r RETURN r[0] AS x, r[1] AS y")
+
+    assert type(first) is type(second)
+    assert vars(first) == {} and vars(second) == {}
+    assert first.keys() == ["x", "y"]
+    assert second["y"] == 4